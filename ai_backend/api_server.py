@@ -3,53 +3,196 @@ Dopamind AI Backend - Flask API Server
 Provides REST API endpoints for emotion simulation and analytics.
 """
 
-from flask import Flask, request, jsonify
+from gevent import monkey
+monkey.patch_all()  # Must run before other imports for gevent workers
+
+from flask import Flask, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-import json
+import functools
+import orjson
+import time
+from collections import defaultdict
+import os
+import redis
 from datetime import datetime
 from emotion_engine import DopamindAI, RewardType, EmotionType
+from session_summary import summarize_session
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    Since Flask 2.2 a handler returning a plain dict is serialized via
+    app.json, so registering this provider routes those returns (and
+    jsonify) through orjson; datetimes, enums and NumPy scalars are all
+    handled natively in C.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for Flutter app
 
+# Match /route and /route/ directly instead of issuing a 301 redirect,
+# which costs SDK clients an extra round-trip on mis-trailed URLs
+app.url_map.strict_slashes = False
+
 # Initialize AI engine
 ai_engine = DopamindAI()
 
+# Valid reward types, computed once (O(1) membership tests on the hot path)
+_VALID_REWARDS = frozenset(rt.value for rt in RewardType)
+_VALID_REWARDS_LIST = sorted(_VALID_REWARDS)
+
+# Direct value -> member map; a plain dict lookup skips Enum.__call__
+# (membership is already guaranteed by the _VALID_REWARDS check)
+_RT_MAP = RewardType._value2member_map_
+
+# Redis cache for read-mostly responses (analytics/insights). Sub-second
+# timeouts and zero connect retries keep an unreachable cache from
+# stalling requests: a down Redis must degrade to a fast miss, not add
+# connect/backoff latency to every call.
+_redis = redis.Redis(
+    host=os.environ.get('REDIS_HOST', 'localhost'),
+    port=int(os.environ.get('REDIS_PORT', 6379)),
+    socket_connect_timeout=0.2,
+    socket_timeout=0.5,
+    retry=redis.retry.Retry(redis.backoff.NoBackoff(), retries=0)
+)
+_ANALYTICS_TTL = 60   # seconds - analytics change slowly
+_INSIGHTS_TTL = 300   # insights are even more stable
+
+def _cache_get(key):
+    """Fetch cached bytes from Redis; treat an unreachable cache as a miss."""
+    try:
+        return _redis.get(key)
+    except redis.RedisError:
+        return None
+
+def _cache_set(key, body, ttl):
+    """Store response bytes in Redis with a TTL; ignore cache failures."""
+    try:
+        _redis.setex(key, ttl, body)
+    except redis.RedisError:
+        pass
+
+def _read_json():
+    """Parse the request body with orjson, straight from the raw bytes."""
+    return orjson.loads(request.get_data(cache=False) or b'{}')
+
+def _json_response(obj, status=200):
+    """Serialize a response with orjson (much faster than Flask's jsonify)."""
+    body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def require_fields(*fields):
+    """Parse the request body and reject it unless all fields are present.
+
+    The parsed body is stashed on request.parsed_json so handlers do not
+    parse it a second time. The presence check is a single C-level set
+    comparison rather than a per-field loop.
+    """
+    required = frozenset(fields)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                data = _read_json()
+            except orjson.JSONDecodeError:
+                return _json_response({
+                    'error': 'Invalid JSON in request body'
+                }, 400)
+            if not isinstance(data, dict):
+                return _json_response({
+                    'error': 'Request body must be a JSON object'
+                }, 400)
+            if not required <= data.keys():
+                missing = next(f for f in fields if f not in data)
+                return _json_response({
+                    'error': f'Missing required field: {missing}'
+                }, 400)
+            request.parsed_json = data
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# Per-endpoint latency stats: route rule -> [request count, total seconds]
+_LATENCY = defaultdict(lambda: [0, 0.0])
+
+def profiled(fn):
+    """Record request count and cumulative latency for the endpoint."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        rule = request.url_rule.rule if request.url_rule else request.path
+        stats = _LATENCY[rule]
+        stats[0] += 1
+        stats[1] += elapsed
+        return result
+    return wrapper
+
+@app.route('/profiling', methods=['GET'])
+def get_profiling():
+    """Per-endpoint latency stats, hottest endpoints first."""
+    report = {
+        rule: {
+            'count': count,
+            'total_ms': total * 1000.0,
+            'avg_ms': total * 1000.0 / count
+        }
+        for rule, (count, total) in sorted(
+            _LATENCY.items(), key=lambda item: item[1][1], reverse=True
+        )
+    }
+    return _json_response(report)
+
+# /health is hammered by load-balancer probes; serve pre-serialized bytes
+# and refresh them at most once a second
+_HEALTH_CACHE = {'t': 0.0, 'body': b''}
+
 @app.route('/health', methods=['GET'])
+@profiled
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
-    })
+    now = time.time()
+    if now - _HEALTH_CACHE['t'] > 1.0:
+        _HEALTH_CACHE['body'] = orjson.dumps({
+            'status': 'healthy',
+            'timestamp': datetime.now(),
+            'version': '1.0.0'
+        })
+        _HEALTH_CACHE['t'] = now
+    return app.response_class(_HEALTH_CACHE['body'], mimetype='application/json')
 
 @app.route('/api/process-reward', methods=['POST'])
+@profiled
+@require_fields('user_id', 'reward_type', 'context')
 def process_reward():
     """Process a reward and return emotion/dopamine predictions."""
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['user_id', 'reward_type', 'context']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'error': f'Missing required field: {field}'
-                }), 400
-        
+        data = request.parsed_json
+
         # Validate reward type
-        valid_rewards = [rt.value for rt in RewardType]
-        if data['reward_type'] not in valid_rewards:
-            return jsonify({
-                'error': f'Invalid reward type. Must be one of: {valid_rewards}'
-            }), 400
+        if data['reward_type'] not in _VALID_REWARDS:
+            return _json_response({
+                'error': f'Invalid reward type. Must be one of: {_VALID_REWARDS_LIST}'
+            }, 400)
         
         # Process the reward
         result = ai_engine.process_reward(
@@ -59,88 +202,99 @@ def process_reward():
             session_history=data.get('session_history', [])
         )
         
-        logger.info(f"Processed reward for user {data['user_id']}: {data['reward_type']}")
+        logger.info("Processed reward for user %s: %s", data['user_id'], data['reward_type'])
         
-        return jsonify(result)
+        return _json_response(result)
         
     except Exception as e:
-        logger.error(f"Error processing reward: {str(e)}")
-        return jsonify({
+        logger.error("Error processing reward: %s", e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/analytics/<user_id>', methods=['GET'])
+@profiled
 def get_user_analytics(user_id):
     """Get analytics for a specific user."""
     try:
         days = request.args.get('days', 7, type=int)
-        
+
+        key = f"analytics:{user_id}:{days}"
+        cached = _cache_get(key)
+        if cached is not None:
+            return app.response_class(cached, mimetype='application/json')
+
         analytics = ai_engine.get_analytics(user_id, days)
-        
-        logger.info(f"Retrieved analytics for user {user_id} ({days} days)")
-        
-        return jsonify(analytics)
+
+        logger.info("Retrieved analytics for user %s (%s days)", user_id, days)
+
+        body = orjson.dumps(analytics, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        _cache_set(key, body, _ANALYTICS_TTL)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Error getting analytics for user {user_id}: {str(e)}")
-        return jsonify({
+        logger.error("Error getting analytics for user %s: %s", user_id, e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/insights', methods=['GET'])
+@profiled
 def get_insights():
     """Get general insights from all data."""
     try:
+        cached = _cache_get("insights")
+        if cached is not None:
+            return app.response_class(cached, mimetype='application/json')
+
         insights = ai_engine.get_insights()
-        
-        return jsonify({
+
+        body = orjson.dumps({
             'insights': insights,
-            'timestamp': datetime.now().isoformat()
-        })
+            'timestamp': datetime.now()
+        }, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        _cache_set("insights", body, _INSIGHTS_TTL)
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
-        logger.error(f"Error getting insights: {str(e)}")
-        return jsonify({
+        logger.error("Error getting insights: %s", e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/emotion-prediction', methods=['POST'])
+@profiled
+@require_fields('user_id', 'reward_type', 'context')
 def predict_emotion():
     """Predict emotion response for a given context."""
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['user_id', 'reward_type', 'context']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'error': f'Missing required field: {field}'
-                }), 400
-        
+        data = request.parsed_json
+
         # Validate reward type
-        valid_rewards = [rt.value for rt in RewardType]
-        if data['reward_type'] not in valid_rewards:
-            return jsonify({
-                'error': f'Invalid reward type. Must be one of: {valid_rewards}'
-            }), 400
+        if data['reward_type'] not in _VALID_REWARDS:
+            return _json_response({
+                'error': f'Invalid reward type. Must be one of: {_VALID_REWARDS_LIST}'
+            }, 400)
         
         # Get prediction
         emotion_state, dopamine_response = ai_engine.learning_engine.get_personalized_prediction(
             data['user_id'],
-            RewardType(data['reward_type']),
+            _RT_MAP[data['reward_type']],
             data['context']
         )
         
+        # Emotion enum and timestamp are left as-is: orjson serializes
+        # Enum members and datetimes natively, so no .value/.isoformat()
+        # string building happens on the Python side
         result = {
             'emotion': {
-                'type': emotion_state.emotion.value,
+                'type': emotion_state.emotion,
                 'intensity': emotion_state.intensity,
                 'confidence': emotion_state.confidence,
-                'timestamp': emotion_state.timestamp.isoformat()
+                'timestamp': emotion_state.timestamp
             },
             'dopamine': {
                 'baseline': dopamine_response.baseline,
@@ -152,189 +306,97 @@ def predict_emotion():
             'user_id': data['user_id']
         }
         
-        logger.info(f"Generated emotion prediction for user {data['user_id']}")
+        logger.info("Generated emotion prediction for user %s", data['user_id'])
         
-        return jsonify(result)
+        return _json_response(result)
         
     except Exception as e:
-        logger.error(f"Error predicting emotion: {str(e)}")
-        return jsonify({
+        logger.error("Error predicting emotion: %s", e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/session-summary', methods=['POST'])
+@profiled
+@require_fields('user_id', 'session_data')
 def get_session_summary():
     """Get a summary of a completed session."""
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['user_id', 'session_data']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    'error': f'Missing required field: {field}'
-                }), 400
-        
-        session_data = data['session_data']
-        
-        # Calculate session metrics
-        total_rewards = len(session_data.get('rewards', []))
-        avg_intensity = sum(r.get('intensity', 0) for r in session_data.get('rewards', [])) / max(total_rewards, 1)
-        session_duration = session_data.get('duration', 0)
-        
-        # Generate insights
-        insights = []
-        if avg_intensity > 0.7:
-            insights.append("High engagement session - great dopamine response!")
-        elif avg_intensity < 0.4:
-            insights.append("Calm session - good for mindfulness practice")
-        
-        if total_rewards > 10:
-            insights.append("Very active session - lots of interactions")
-        elif total_rewards < 3:
-            insights.append("Minimal session - consider longer engagement")
-        
-        if session_duration > 300:  # 5 minutes
-            insights.append("Long session - good for building habits")
-        
-        # Calculate dopamine trend
-        rewards = session_data.get('rewards', [])
-        if len(rewards) > 1:
-            first_half = rewards[:len(rewards)//2]
-            second_half = rewards[len(rewards)//2:]
-            
-            first_avg = sum(r.get('intensity', 0) for r in first_half) / max(len(first_half), 1)
-            second_avg = sum(r.get('intensity', 0) for r in second_half) / max(len(second_half), 1)
-            
-            if second_avg > first_avg * 1.1:
-                insights.append("Dopamine levels increased during session - great momentum!")
-            elif second_avg < first_avg * 0.9:
-                insights.append("Dopamine levels decreased - consider taking breaks")
-        
-        summary = {
-            'user_id': data['user_id'],
-            'session_metrics': {
-                'total_rewards': total_rewards,
-                'average_intensity': avg_intensity,
-                'session_duration': session_duration,
-                'dopamine_trend': 'increasing' if len(rewards) > 1 and second_avg > first_avg else 'stable'
-            },
-            'insights': insights,
-            'recommendations': _generate_recommendations(session_data),
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        logger.info(f"Generated session summary for user {data['user_id']}")
+        data = request.parsed_json
+        summary = summarize_session(data['user_id'], data['session_data'])
+
+        logger.info("Generated session summary for user %s", data['user_id'])
         
-        return jsonify(summary)
+        return _json_response(summary)
         
     except Exception as e:
-        logger.error(f"Error generating session summary: {str(e)}")
-        return jsonify({
+        logger.error("Error generating session summary: %s", e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
-
-def _generate_recommendations(session_data):
-    """Generate personalized recommendations based on session data."""
-    recommendations = []
-    
-    rewards = session_data.get('rewards', [])
-    if not rewards:
-        return ["Try interacting more to get better insights"]
-    
-    # Analyze reward types
-    reward_types = [r.get('type', '') for r in rewards]
-    type_counts = {}
-    for rt in reward_types:
-        type_counts[rt] = type_counts.get(rt, 0) + 1
-    
-    # Find most/least used reward types
-    if type_counts:
-        most_used = max(type_counts, key=type_counts.get)
-        least_used = min(type_counts, key=type_counts.get)
-        
-        if type_counts[most_used] > len(rewards) * 0.6:
-            recommendations.append(f"You used {most_used} rewards frequently - try exploring {least_used} for variety")
-        
-        if type_counts[least_used] == 0:
-            recommendations.append(f"Consider trying {least_used} rewards for different emotional responses")
-    
-    # Time-based recommendations
-    session_duration = session_data.get('duration', 0)
-    if session_duration < 60:  # Less than 1 minute
-        recommendations.append("Try longer sessions for better habit formation")
-    elif session_duration > 1800:  # More than 30 minutes
-        recommendations.append("Consider shorter, more focused sessions")
-    
-    # Intensity recommendations
-    avg_intensity = sum(r.get('intensity', 0) for r in rewards) / len(rewards)
-    if avg_intensity > 0.8:
-        recommendations.append("High intensity session - great for building excitement!")
-    elif avg_intensity < 0.3:
-        recommendations.append("Low intensity session - good for calm, mindful practice")
-    
-    return recommendations
+        }, 500)
+
+def _process_single_reward(reward_data):
+    """Process one reward from a batch, turning failures into error entries."""
+    try:
+        return ai_engine.process_reward(
+            user_id=reward_data['user_id'],
+            reward_type=reward_data['reward_type'],
+            context=reward_data['context'],
+            session_history=reward_data.get('session_history', [])
+        )
+    except Exception as e:
+        logger.error("Error processing reward in batch: %s", e)
+        return {
+            'error': str(e),
+            'reward_data': reward_data
+        }
 
 @app.route('/api/batch-process', methods=['POST'])
+@profiled
+@require_fields('rewards')
 def batch_process_rewards():
     """Process multiple rewards in a batch."""
     try:
-        data = request.get_json()
-        
-        if 'rewards' not in data:
-            return jsonify({
-                'error': 'Missing required field: rewards'
-            }), 400
-        
-        results = []
-        for reward_data in data['rewards']:
-            try:
-                result = ai_engine.process_reward(
-                    user_id=reward_data['user_id'],
-                    reward_type=reward_data['reward_type'],
-                    context=reward_data['context'],
-                    session_history=reward_data.get('session_history', [])
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing reward in batch: {str(e)}")
-                results.append({
-                    'error': str(e),
-                    'reward_data': reward_data
-                })
-        
-        return jsonify({
+        data = request.parsed_json
+        # CPU-bound work with gevent monkey-patching in effect: a thread
+        # pool would run items sequentially anyway (greenlet "threads"
+        # never yield mid-item), so process inline and keep the engine's
+        # unsynchronized state safe from concurrent writers
+        results = [_process_single_reward(rd) for rd in data['rewards']]
+        
+        return _json_response({
             'results': results,
             'total_processed': len(results),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
         })
         
     except Exception as e:
-        logger.error(f"Error in batch processing: {str(e)}")
-        return jsonify({
+        logger.error("Error in batch processing: %s", e)
+        return _json_response({
             'error': 'Internal server error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
+    return _json_response({
         'error': 'Endpoint not found',
         'message': 'The requested endpoint does not exist'
-    }), 404
+    }, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
+    return _json_response({
         'error': 'Internal server error',
         'message': 'An unexpected error occurred'
-    }), 500
+    }, 500)
 
 if __name__ == '__main__':
-    logger.info("Starting Dopamind AI Backend Server...")
+    # Local development only - production runs under gunicorn (see Dockerfile):
+    #   gunicorn api_server:app --worker-class gevent --workers $((2 * cores))
+    logger.info("Starting Dopamind AI Backend Server (dev mode)...")
     app.run(
         host='0.0.0.0',
         port=5000,
@@ -0,0 +1,193 @@
+"""
+Dopamind AI Backend - Falcon ASGI Server
+ASGI port of the Flask API with an orjson media handler. Falcon does far
+less per-request work than Flask's WSGI stack, so the same endpoints
+serve noticeably more requests per second on the same hardware.
+
+Run with:
+    uvicorn asgi_app:app --workers $((2 * $(nproc))) --host 0.0.0.0 --port 5000
+"""
+
+import falcon
+import falcon.asgi
+import falcon.media
+import functools
+import orjson
+import logging
+from datetime import datetime
+from emotion_engine import DopamindAI, RewardType
+from session_summary import summarize_session
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Shared AI engine (one per worker process)
+ai_engine = DopamindAI()
+
+# Valid reward types, computed once
+_VALID_REWARDS = frozenset(rt.value for rt in RewardType)
+_VALID_REWARDS_LIST = sorted(_VALID_REWARDS)
+
+
+def _validate(data, *fields):
+    """Return an error message if a required field is missing, else None."""
+    if not isinstance(data, dict):
+        return 'Request body must be a JSON object'
+    for field in fields:
+        if field not in data:
+            return f'Missing required field: {field}'
+    return None
+
+
+class HealthResource:
+    async def on_get(self, req, resp):
+        resp.media = {
+            'status': 'healthy',
+            'timestamp': datetime.now().isoformat(),
+            'version': '1.0.0'
+        }
+
+
+class ProcessRewardResource:
+    async def on_post(self, req, resp):
+        data = await req.get_media(default_when_empty={})
+
+        error = _validate(data, 'user_id', 'reward_type', 'context')
+        if error:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': error}
+            return
+
+        if data['reward_type'] not in _VALID_REWARDS:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': f'Invalid reward type. Must be one of: {_VALID_REWARDS_LIST}'}
+            return
+
+        resp.media = ai_engine.process_reward(
+            user_id=data['user_id'],
+            reward_type=data['reward_type'],
+            context=data['context'],
+            session_history=data.get('session_history', [])
+        )
+
+
+class AnalyticsResource:
+    async def on_get(self, req, resp, user_id):
+        days = req.get_param_as_int('days', default=7)
+        resp.media = ai_engine.get_analytics(user_id, days)
+
+
+class InsightsResource:
+    async def on_get(self, req, resp):
+        resp.media = {
+            'insights': ai_engine.get_insights(),
+            'timestamp': datetime.now().isoformat()
+        }
+
+
+class EmotionPredictionResource:
+    async def on_post(self, req, resp):
+        data = await req.get_media(default_when_empty={})
+
+        error = _validate(data, 'user_id', 'reward_type', 'context')
+        if error:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': error}
+            return
+
+        if data['reward_type'] not in _VALID_REWARDS:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': f'Invalid reward type. Must be one of: {_VALID_REWARDS_LIST}'}
+            return
+
+        emotion_state, dopamine_response = ai_engine.learning_engine.get_personalized_prediction(
+            data['user_id'],
+            RewardType(data['reward_type']),
+            data['context']
+        )
+
+        resp.media = {
+            'emotion': {
+                'type': emotion_state.emotion.value,
+                'intensity': emotion_state.intensity,
+                'confidence': emotion_state.confidence,
+                'timestamp': emotion_state.timestamp.isoformat()
+            },
+            'dopamine': {
+                'baseline': dopamine_response.baseline,
+                'peak': dopamine_response.peak,
+                'duration': dopamine_response.duration,
+                'decay_rate': dopamine_response.decay_rate,
+                'emotional_impact': dopamine_response.emotional_impact
+            },
+            'user_id': data['user_id']
+        }
+
+
+class SessionSummaryResource:
+    async def on_post(self, req, resp):
+        data = await req.get_media(default_when_empty={})
+
+        error = _validate(data, 'user_id', 'session_data')
+        if error:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': error}
+            return
+
+        resp.media = summarize_session(data['user_id'], data['session_data'])
+
+
+class BatchProcessResource:
+    async def on_post(self, req, resp):
+        data = await req.get_media(default_when_empty={})
+
+        error = _validate(data, 'rewards')
+        if error:
+            resp.status = falcon.HTTP_400
+            resp.media = {'error': error}
+            return
+
+        results = []
+        for reward_data in data['rewards']:
+            try:
+                results.append(ai_engine.process_reward(
+                    user_id=reward_data['user_id'],
+                    reward_type=reward_data['reward_type'],
+                    context=reward_data['context'],
+                    session_history=reward_data.get('session_history', [])
+                ))
+            except Exception as e:
+                logger.error("Error processing reward in batch: %s", e)
+                results.append({'error': str(e), 'reward_data': reward_data})
+
+        resp.media = {
+            'results': results,
+            'total_processed': len(results),
+            'timestamp': datetime.now().isoformat()
+        }
+
+
+async def _handle_malformed_media(req, resp, ex, params):
+    """Match the Flask API's bad-JSON error shape."""
+    resp.status = falcon.HTTP_400
+    resp.media = {'error': 'Invalid JSON in request body'}
+
+
+# ASGI app with orjson handling both request and response JSON
+app = falcon.asgi.App(cors_enable=True)
+app.add_error_handler(falcon.MediaMalformedError, _handle_malformed_media)
+json_handler = falcon.media.JSONHandler(
+    dumps=functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+    loads=orjson.loads
+)
+app.req_options.media_handlers.update({falcon.MEDIA_JSON: json_handler})
+app.resp_options.media_handlers.update({falcon.MEDIA_JSON: json_handler})
+
+app.add_route('/health', HealthResource())
+app.add_route('/api/process-reward', ProcessRewardResource())
+app.add_route('/api/analytics/{user_id}', AnalyticsResource())
+app.add_route('/api/insights', InsightsResource())
+app.add_route('/api/emotion-prediction', EmotionPredictionResource())
+app.add_route('/api/session-summary', SessionSummaryResource())
+app.add_route('/api/batch-process', BatchProcessResource())
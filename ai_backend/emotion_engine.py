@@ -4,11 +4,11 @@ Simulates emotional responses and dopamine patterns for the Dopamind app.
 """
 
 import numpy as np
-import pandas as pd
+from numba import njit
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import json
-import random
+import time
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,6 +24,10 @@ class EmotionType(Enum):
     TIRED = "tired"
     SAD = "sad"
 
+# Stable ordinal per emotion, mirroring _REWARD_INDEX below
+_EMOTION_INDEX = {et: i for i, et in enumerate(EmotionType)}
+_EMOTION_VALUES = tuple(et.value for et in EmotionType)
+
 class RewardType(Enum):
     LIKE = "like"
     COMMENT = "comment"
@@ -34,14 +38,92 @@ class RewardType(Enum):
     STREAK = "streak"
     MILESTONE = "milestone"
 
+# Stable ordinal per reward type, used to index the lookup-table arrays
+# in the vectorized batch paths
+_REWARD_INDEX = {rt: i for i, rt in enumerate(RewardType)}
+
+# Wire-string to ordinal and back: one dict probe replaces the enum
+# constructor's try/except on the hot validation path
+_REWARD_STR2IDX = {rt.value: i for i, rt in enumerate(RewardType)}
+_REWARD_BY_IDX = tuple(RewardType)
+
+# Per-reward constants, indexed by _REWARD_INDEX ordinal. Hoisted to
+# module scope so the hot methods never rebuild a dict per call.
+_REWARD_MODIFIERS_ARR = np.array(
+    [0.3, 0.5, 0.7, 0.8, 0.6, 0.6, 0.7, 0.9], dtype=np.float32
+)
+_REWARD_EMOTION = (
+    EmotionType.HAPPY,      # LIKE
+    EmotionType.EXCITED,    # COMMENT
+    EmotionType.ENERGETIC,  # SHARE
+    EmotionType.EXCITED,    # ACHIEVEMENT
+    EmotionType.HAPPY,      # CONNECTION
+    EmotionType.FOCUSED,    # DISCOVERY
+    EmotionType.ENERGETIC,  # STREAK
+    EmotionType.EXCITED,    # MILESTONE
+)
+_REWARD_PEAKS = np.array(
+    [0.6, 0.7, 0.8, 0.9, 0.7, 0.8, 0.8, 0.95], dtype=np.float32
+)
+_REWARD_DURATIONS = np.array(
+    [2.0, 3.0, 4.0, 5.0, 3.5, 4.5, 5.0, 6.0], dtype=np.float32
+)
+
+# Hour-of-day bitmasks for context adjustment: bit h is set when hour h
+# belongs to the window, so the check is one shift-and instead of a list
+# membership scan per call
+_PEAK_HOUR_MASK = sum(1 << h for h in (9, 10, 11, 14, 15, 16))
+_NIGHT_HOUR_MASK = sum(1 << h for h in (0, 1, 2, 3, 4, 5, 22, 23))
+
+_BASE_EMOTION_WEIGHTS = {
+    EmotionType.HAPPY: 0.7,
+    EmotionType.EXCITED: 0.6,
+    EmotionType.CALM: 0.5,
+    EmotionType.FOCUSED: 0.8,
+    EmotionType.ANXIOUS: 0.3,
+    EmotionType.FRUSTRATED: 0.2,
+    EmotionType.CONTENT: 0.6,
+    EmotionType.ENERGETIC: 0.7,
+    EmotionType.TIRED: 0.4,
+    EmotionType.SAD: 0.2,
+}
+
+@njit(cache=True, fastmath=True)
+def _intensity_kernel(reward_idx, fatigue, stress, mood_pos, recent_same):
+    """Numeric core of the emotion-intensity calculation, JIT-compiled
+    so the branchy arithmetic runs as native code instead of bytecode."""
+    intensity = 0.5 + _REWARD_MODIFIERS_ARR[reward_idx]
+    if fatigue > 0.7:
+        intensity *= 0.8  # Reduce intensity when tired
+    if stress > 0.6:
+        intensity *= 0.9  # Slightly reduce when stressed
+    if mood_pos:
+        intensity *= 1.1  # Boost when in good mood
+    if recent_same > 2:
+        intensity *= 0.9  # Diminishing returns for repeated rewards
+    if intensity < 0.0:
+        return 0.0
+    if intensity > 1.0:
+        return 1.0
+    return intensity
+
+# Warm the JIT cache at import so the first request does not pay the
+# compile latency
+_intensity_kernel(0, 0.0, 0.0, False, 0)
+
 @dataclass
 class EmotionState:
     emotion: EmotionType
     intensity: float  # 0.0 to 1.0
     confidence: float  # 0.0 to 1.0
-    timestamp: datetime
+    timestamp_ns: int  # epoch nanoseconds (time.time_ns())
     context: Dict[str, any]
 
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp as a datetime, constructed only when output needs it."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
 @dataclass
 class DopamineResponse:
     baseline: float
@@ -50,28 +132,27 @@ class DopamineResponse:
     decay_rate: float
     emotional_impact: float
 
+# Jitter draws refilled in blocks; must be a power of two for the
+# wrap-around mask in simulate_emotion_response
+_JITTER_BLOCK = 4096
+
 class EmotionSimulator:
     """Simulates emotional responses based on user interactions and context."""
-    
+
     def __init__(self):
         self.emotion_weights = self._initialize_emotion_weights()
         self.dopamine_baseline = 0.3
         self.learning_rate = 0.1
+        # Per-request randomness comes from a preallocated block of
+        # uniform draws; one bulk rng call per 4096 requests instead of
+        # a generator call per request
+        self._rng = np.random.default_rng()
+        self._jitter = self._rng.uniform(-0.1, 0.1, _JITTER_BLOCK).astype(np.float32)
+        self._jitter_idx = 0
         
     def _initialize_emotion_weights(self) -> Dict[EmotionType, float]:
-        """Initialize base emotion weights."""
-        return {
-            EmotionType.HAPPY: 0.7,
-            EmotionType.EXCITED: 0.6,
-            EmotionType.CALM: 0.5,
-            EmotionType.FOCUSED: 0.8,
-            EmotionType.ANXIOUS: 0.3,
-            EmotionType.FRUSTRATED: 0.2,
-            EmotionType.CONTENT: 0.6,
-            EmotionType.ENERGETIC: 0.7,
-            EmotionType.TIRED: 0.4,
-            EmotionType.SAD: 0.2,
-        }
+        """Initialize base emotion weights from the shared constants."""
+        return dict(_BASE_EMOTION_WEIGHTS)
     
     def simulate_emotion_response(
         self, 
@@ -89,9 +170,13 @@ class EmotionSimulator:
             reward_type, user_context, session_history
         )
         
-        # Add some randomness for realism
-        intensity += random.uniform(-0.1, 0.1)
-        intensity = np.clip(intensity, 0.0, 1.0)
+        # Add some randomness for realism, consuming the jitter block;
+        # scalar min/max beats np.clip's dispatch for a single float
+        intensity += float(self._jitter[self._jitter_idx])
+        self._jitter_idx = (self._jitter_idx + 1) & (_JITTER_BLOCK - 1)
+        if self._jitter_idx == 0:
+            self._jitter = self._rng.uniform(-0.1, 0.1, _JITTER_BLOCK).astype(np.float32)
+        intensity = 0.0 if intensity < 0.0 else 1.0 if intensity > 1.0 else intensity
         
         # Calculate confidence based on consistency
         confidence = self._calculate_confidence(session_history)
@@ -100,65 +185,37 @@ class EmotionSimulator:
             emotion=base_emotion,
             intensity=intensity,
             confidence=confidence,
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
             context=user_context
         )
     
     def _get_reward_emotion(self, reward_type: RewardType) -> EmotionType:
         """Map reward types to primary emotions."""
-        emotion_map = {
-            RewardType.LIKE: EmotionType.HAPPY,
-            RewardType.COMMENT: EmotionType.EXCITED,
-            RewardType.SHARE: EmotionType.ENERGETIC,
-            RewardType.ACHIEVEMENT: EmotionType.EXCITED,
-            RewardType.CONNECTION: EmotionType.HAPPY,
-            RewardType.DISCOVERY: EmotionType.FOCUSED,
-            RewardType.STREAK: EmotionType.ENERGETIC,
-            RewardType.MILESTONE: EmotionType.EXCITED,
-        }
-        return emotion_map.get(reward_type, EmotionType.HAPPY)
+        return _REWARD_EMOTION[_REWARD_INDEX[reward_type]]
     
     def _calculate_emotion_intensity(
-        self, 
+        self,
         reward_type: RewardType,
         user_context: Dict[str, any],
         session_history: List[Dict[str, any]] = None
     ) -> float:
         """Calculate emotion intensity based on various factors."""
-        
-        base_intensity = 0.5
-        
-        # Reward type modifier
-        reward_modifiers = {
-            RewardType.LIKE: 0.3,
-            RewardType.COMMENT: 0.5,
-            RewardType.SHARE: 0.7,
-            RewardType.ACHIEVEMENT: 0.8,
-            RewardType.CONNECTION: 0.6,
-            RewardType.DISCOVERY: 0.6,
-            RewardType.STREAK: 0.7,
-            RewardType.MILESTONE: 0.9,
-        }
-        
-        intensity = base_intensity + reward_modifiers.get(reward_type, 0.5)
-        
-        # User context modifiers
-        if user_context.get('fatigue_level', 0) > 0.7:
-            intensity *= 0.8  # Reduce intensity when tired
-        
-        if user_context.get('stress_level', 0) > 0.6:
-            intensity *= 0.9  # Slightly reduce when stressed
-        
-        if user_context.get('mood', 'neutral') == 'positive':
-            intensity *= 1.1  # Boost when in good mood
-        
-        # Session history modifiers
+
+        # Count repeats of this reward in the recent history, then hand
+        # the numeric work to the JIT-compiled kernel
+        recent_same = 0
         if session_history:
-            recent_rewards = [r for r in session_history[-5:] if r.get('type') == reward_type.value]
-            if len(recent_rewards) > 2:
-                intensity *= 0.9  # Diminishing returns for repeated rewards
-        
-        return np.clip(intensity, 0.0, 1.0)
+            recent_same = sum(
+                1 for r in session_history[-5:] if r.get('type') == reward_type.value
+            )
+
+        return float(_intensity_kernel(
+            _REWARD_INDEX[reward_type],
+            float(user_context.get('fatigue_level', 0)),
+            float(user_context.get('stress_level', 0)),
+            user_context.get('mood', 'neutral') == 'positive',
+            recent_same
+        ))
     
     def _calculate_confidence(self, session_history: List[Dict[str, any]] = None) -> float:
         """Calculate confidence in emotion prediction."""
@@ -178,7 +235,48 @@ class DopamineSimulator:
         self.baseline_dopamine = 0.3
         self.peak_dopamine = 0.8
         self.decay_rate = 0.1
-        
+        # Lookup tables indexed by RewardType ordinal (see _REWARD_INDEX),
+        # so batch simulation gathers per-reward constants in one pass
+        self._peak_lut = _REWARD_PEAKS
+        self._duration_lut = _REWARD_DURATIONS
+
+    def simulate_dopamine_response_batch(
+        self,
+        reward_idx: np.ndarray,
+        intensity: np.ndarray,
+        confidence: np.ndarray,
+        context: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Simulate dopamine responses for a whole batch of rewards.
+
+        Arguments are parallel 1D arrays (struct-of-arrays): reward type
+        ordinals plus per-reward emotion intensity/confidence, and a dict
+        of context arrays (fatigue, stress, mood_positive). Returns a
+        dict of arrays mirroring the fields of DopamineResponse.
+        """
+        fatigue = context.get('fatigue', np.zeros(len(reward_idx), dtype=np.float32))
+        stress = context.get('stress', np.zeros(len(reward_idx), dtype=np.float32))
+        mood_pos = context.get('mood_positive', np.zeros(len(reward_idx), dtype=bool))
+
+        baseline = np.full(len(reward_idx), self.baseline_dopamine, dtype=np.float32)
+        baseline *= np.where(fatigue > 0.7, 0.8, 1.0)
+        baseline *= np.where(stress > 0.6, 0.9, 1.0)
+        baseline *= np.where(mood_pos, 1.1, 1.0)
+        baseline = np.clip(baseline, 0.1, 0.5)
+
+        peak = np.clip(self._peak_lut[reward_idx] * (0.5 + intensity * 0.5), 0.3, 1.0)
+        duration = self._duration_lut[reward_idx]
+        decay_rate = 0.05 + (intensity * 0.1)
+        emotional_impact = intensity * confidence
+
+        return {
+            'baseline': baseline,
+            'peak': peak,
+            'duration': duration,
+            'decay_rate': decay_rate,
+            'emotional_impact': emotional_impact
+        }
+
     def simulate_dopamine_response(
         self,
         reward_type: RewardType,
@@ -233,18 +331,7 @@ class DopamineSimulator:
     ) -> float:
         """Calculate peak dopamine level."""
         
-        reward_peaks = {
-            RewardType.LIKE: 0.6,
-            RewardType.COMMENT: 0.7,
-            RewardType.SHARE: 0.8,
-            RewardType.ACHIEVEMENT: 0.9,
-            RewardType.CONNECTION: 0.7,
-            RewardType.DISCOVERY: 0.8,
-            RewardType.STREAK: 0.8,
-            RewardType.MILESTONE: 0.95,
-        }
-        
-        base_peak = reward_peaks.get(reward_type, 0.6)
+        base_peak = float(_REWARD_PEAKS[_REWARD_INDEX[reward_type]])
         
         # Adjust based on emotion intensity
         peak = base_peak * (0.5 + emotion_state.intensity * 0.5)
@@ -253,40 +340,75 @@ class DopamineSimulator:
     
     def _calculate_duration(self, reward_type: RewardType) -> float:
         """Calculate dopamine response duration."""
-        durations = {
-            RewardType.LIKE: 2.0,
-            RewardType.COMMENT: 3.0,
-            RewardType.SHARE: 4.0,
-            RewardType.ACHIEVEMENT: 5.0,
-            RewardType.CONNECTION: 3.5,
-            RewardType.DISCOVERY: 4.5,
-            RewardType.STREAK: 5.0,
-            RewardType.MILESTONE: 6.0,
-        }
-        
-        return durations.get(reward_type, 3.0)
+        return float(_REWARD_DURATIONS[_REWARD_INDEX[reward_type]])
     
     def _calculate_decay_rate(self, emotion_intensity: float) -> float:
         """Calculate dopamine decay rate."""
         # Higher intensity emotions decay faster
         return 0.05 + (emotion_intensity * 0.1)
 
+# Entries kept per (reward, emotion) pair in the learning engine
+_RING_CAPACITY = 100
+
+class _RingBuffer:
+    """Fixed-capacity ring buffer of emotion samples, stored column-wise.
+
+    Appends are O(1) writes into preallocated float32/int64 arrays, so
+    trimming never reallocates, and the aggregate queries run on
+    contiguous array views instead of lists of dicts.
+    """
+    __slots__ = ('intensity', 'confidence', 'ts_ns', 'head',
+                 'intensity_sum', 'confidence_sum')
+
+    def __init__(self, capacity: int = _RING_CAPACITY):
+        self.intensity = np.empty(capacity, dtype=np.float32)
+        self.confidence = np.empty(capacity, dtype=np.float32)
+        self.ts_ns = np.empty(capacity, dtype=np.int64)
+        self.head = 0
+        # Running sums over the live window, maintained on append so
+        # averages are O(1) instead of re-reducing the arrays
+        self.intensity_sum = 0.0
+        self.confidence_sum = 0.0
+
+    def append(self, intensity: float, confidence: float, ts_ns: int):
+        i = self.head % self.intensity.size
+        if self.head >= self.intensity.size:
+            # Overwriting: retire the evicted sample from the sums
+            self.intensity_sum -= float(self.intensity[i])
+            self.confidence_sum -= float(self.confidence[i])
+        self.intensity[i] = intensity
+        self.confidence[i] = confidence
+        self.ts_ns[i] = ts_ns
+        self.intensity_sum += intensity
+        self.confidence_sum += confidence
+        self.head += 1
+
+    def __len__(self):
+        return min(self.head, self.intensity.size)
+
 class AdaptiveLearningEngine:
     """Learns from user patterns to improve emotion simulation."""
-    
-    def __init__(self):
+
+    def __init__(self, emotion_simulator: 'EmotionSimulator' = None,
+                 dopamine_simulator: 'DopamineSimulator' = None):
+        # Simulators are injected by DopamindAI so prediction fallbacks
+        # reuse them instead of instantiating new ones per call
+        self.emotion_simulator = emotion_simulator or EmotionSimulator()
+        self.dopamine_simulator = dopamine_simulator or DopamineSimulator()
         self.user_patterns = {}
         self.learning_rate = 0.1
-        
+        self._hour = time.localtime().tm_hour
+        self._hour_cached_at = time.time_ns()
+
     def update_patterns(
-        self, 
-        user_id: str, 
-        emotion_state: EmotionState, 
+        self,
+        user_id: str,
+        emotion_state: EmotionState,
         reward_type: RewardType,
         actual_response: Dict[str, any] = None
     ):
         """Update user patterns based on new data."""
-        
+
         if user_id not in self.user_patterns:
             self.user_patterns[user_id] = {
                 'emotion_preferences': {},
@@ -294,24 +416,22 @@ class AdaptiveLearningEngine:
                 'temporal_patterns': {},
                 'context_sensitivity': {}
             }
-        
+
         patterns = self.user_patterns[user_id]
-        
-        # Update emotion preferences
-        emotion_key = f"{reward_type.value}_{emotion_state.emotion.value}"
-        if emotion_key not in patterns['emotion_preferences']:
-            patterns['emotion_preferences'][emotion_key] = []
-        
-        patterns['emotion_preferences'][emotion_key].append({
-            'intensity': emotion_state.intensity,
-            'confidence': emotion_state.confidence,
-            'timestamp': emotion_state.timestamp
-        })
-        
-        # Keep only recent data (last 100 entries)
-        if len(patterns['emotion_preferences'][emotion_key]) > 100:
-            patterns['emotion_preferences'][emotion_key] = \
-                patterns['emotion_preferences'][emotion_key][-100:]
+
+        # Update emotion preferences; the ring buffer caps history at
+        # _RING_CAPACITY entries without any list slicing. Buffers are
+        # keyed by reward ordinal, then emotion ordinal, so prediction
+        # can fetch one reward's buffers without scanning string keys.
+        bufs = patterns['emotion_preferences'].setdefault(
+            _REWARD_INDEX[reward_type], {}
+        )
+        buf = bufs.setdefault(_EMOTION_INDEX[emotion_state.emotion], _RingBuffer())
+        buf.append(
+            emotion_state.intensity,
+            emotion_state.confidence,
+            emotion_state.timestamp_ns
+        )
     
     def get_personalized_prediction(
         self, 
@@ -323,13 +443,10 @@ class AdaptiveLearningEngine:
         
         if user_id not in self.user_patterns:
             # Use default predictions for new users
-            emotion_sim = EmotionSimulator()
-            dopamine_sim = DopamineSimulator()
-            
-            emotion_state = emotion_sim.simulate_emotion_response(
+            emotion_state = self.emotion_simulator.simulate_emotion_response(
                 reward_type, context
             )
-            dopamine_response = dopamine_sim.simulate_dopamine_response(
+            dopamine_response = self.dopamine_simulator.simulate_dopamine_response(
                 reward_type, emotion_state, context
             )
             
@@ -337,32 +454,32 @@ class AdaptiveLearningEngine:
         
         # Use learned patterns for existing users
         patterns = self.user_patterns[user_id]
-        
-        # Get historical data for this reward type
-        emotion_key = f"{reward_type.value}_*"
-        historical_data = []
-        
-        for key, data in patterns['emotion_preferences'].items():
-            if key.startswith(reward_type.value):
-                historical_data.extend(data)
-        
-        if not historical_data:
+
+        # Direct lookup of this reward's buffers; the nested dict plus
+        # per-buffer running sums make the averages O(#emotions seen)
+        bufs = patterns['emotion_preferences'].get(_REWARD_INDEX[reward_type])
+        n_samples = 0
+        intensity_sum = confidence_sum = 0.0
+        if bufs:
+            for buf in bufs.values():
+                n_samples += len(buf)
+                intensity_sum += buf.intensity_sum
+                confidence_sum += buf.confidence_sum
+
+        if not n_samples:
             # Fallback to default if no historical data
-            emotion_sim = EmotionSimulator()
-            dopamine_sim = DopamineSimulator()
-            
-            emotion_state = emotion_sim.simulate_emotion_response(
+            emotion_state = self.emotion_simulator.simulate_emotion_response(
                 reward_type, context
             )
-            dopamine_response = dopamine_sim.simulate_dopamine_response(
+            dopamine_response = self.dopamine_simulator.simulate_dopamine_response(
                 reward_type, emotion_state, context
             )
             
             return emotion_state, dopamine_response
         
-        # Calculate personalized predictions
-        avg_intensity = np.mean([d['intensity'] for d in historical_data])
-        avg_confidence = np.mean([d['confidence'] for d in historical_data])
+        # Calculate personalized predictions from the running sums
+        avg_intensity = intensity_sum / n_samples
+        avg_confidence = confidence_sum / n_samples
         
         # Apply context adjustments
         context_adjustment = self._calculate_context_adjustment(context, patterns)
@@ -372,12 +489,11 @@ class AdaptiveLearningEngine:
             emotion=EmotionType.HAPPY,  # Default, could be learned
             intensity=np.clip(adjusted_intensity, 0.0, 1.0),
             confidence=np.clip(avg_confidence, 0.0, 1.0),
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
             context=context
         )
         
-        dopamine_sim = DopamineSimulator()
-        dopamine_response = dopamine_sim.simulate_dopamine_response(
+        dopamine_response = self.dopamine_simulator.simulate_dopamine_response(
             reward_type, emotion_state, context
         )
         
@@ -391,11 +507,16 @@ class AdaptiveLearningEngine:
         """Calculate context-based adjustment factor."""
         adjustment = 1.0
         
-        # Time-based adjustments
-        current_hour = datetime.now().hour
-        if current_hour in [9, 10, 11, 14, 15, 16]:  # Peak hours
+        # Time-based adjustments; the current hour is refreshed at most
+        # once a minute instead of building a datetime per call
+        now_ns = time.time_ns()
+        if now_ns - self._hour_cached_at > 60_000_000_000:
+            self._hour = time.localtime(now_ns // 1_000_000_000).tm_hour
+            self._hour_cached_at = now_ns
+        current_hour = self._hour
+        if (_PEAK_HOUR_MASK >> current_hour) & 1:
             adjustment *= 1.1
-        elif current_hour in [22, 23, 0, 1, 2, 3, 4, 5]:  # Late night/early morning
+        elif (_NIGHT_HOUR_MASK >> current_hour) & 1:
             adjustment *= 0.9
         
         # Fatigue adjustments
@@ -408,84 +529,135 @@ class AdaptiveLearningEngine:
         
         return adjustment
 
+_NS_PER_DAY = 86_400_000_000_000
+
 class EmotionAIAnalytics:
-    """Provides analytics and insights from emotion data."""
-    
+    """Provides analytics and insights from emotion data.
+
+    Data is stored column-wise in preallocated NumPy arrays (doubling
+    capacity on overflow) rather than a list of dicts, so trend and
+    insight queries are vectorized aggregations with no per-row Python
+    work and no DataFrame construction.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
     def __init__(self):
-        self.data = []
-    
+        self._n = 0
+        self._capacity = self._INITIAL_CAPACITY
+        self._intensity = np.empty(self._capacity, dtype=np.float32)
+        self._confidence = np.empty(self._capacity, dtype=np.float32)
+        self._ts_ns = np.empty(self._capacity, dtype=np.int64)
+        self._emotion_id = np.empty(self._capacity, dtype=np.int8)
+        self._reward_id = np.empty(self._capacity, dtype=np.int8)
+        # Whole-history aggregates maintained on insert so get_insights
+        # never rescans the columns
+        self._intensity_sum = 0.0
+        self._confidence_sum = 0.0
+        self._emotion_hist = np.zeros(len(EmotionType), dtype=np.int64)
+
+    def _grow(self):
+        """Double the column capacity."""
+        self._capacity *= 2
+        for name in ('_intensity', '_confidence', '_ts_ns', '_emotion_id', '_reward_id'):
+            old = getattr(self, name)
+            new = np.empty(self._capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
     def add_emotion_data(self, emotion_state: EmotionState, reward_type: RewardType):
         """Add new emotion data for analysis."""
-        self.data.append({
-            'emotion': emotion_state.emotion.value,
-            'intensity': emotion_state.intensity,
-            'confidence': emotion_state.confidence,
-            'reward_type': reward_type.value,
-            'timestamp': emotion_state.timestamp
-        })
-    
+        if self._n == self._capacity:
+            self._grow()
+        i = self._n
+        self._intensity[i] = emotion_state.intensity
+        self._confidence[i] = emotion_state.confidence
+        self._ts_ns[i] = emotion_state.timestamp_ns
+        emotion_idx = _EMOTION_INDEX[emotion_state.emotion]
+        self._emotion_id[i] = emotion_idx
+        self._reward_id[i] = _REWARD_INDEX[reward_type]
+        self._n = i + 1
+        self._intensity_sum += emotion_state.intensity
+        self._confidence_sum += emotion_state.confidence
+        self._emotion_hist[emotion_idx] += 1
+
     def get_emotion_trends(self, days: int = 7) -> Dict[str, any]:
         """Get emotion trends over specified days."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_data = [
-            d for d in self.data 
-            if d['timestamp'] >= cutoff_date
-        ]
-        
-        if not recent_data:
+        n = self._n
+        cutoff_ns = int((datetime.now() - timedelta(days=days)).timestamp() * 1e9)
+        mask = self._ts_ns[:n] >= cutoff_ns
+        total_entries = int(mask.sum())
+
+        if total_entries == 0:
             return {'error': 'No data available'}
-        
-        df = pd.DataFrame(recent_data)
-        
-        # Calculate trends
-        emotion_counts = df['emotion'].value_counts()
-        avg_intensity = df['intensity'].mean()
-        avg_confidence = df['confidence'].mean()
-        
-        # Calculate daily patterns
-        df['date'] = df['timestamp'].dt.date
-        daily_patterns = df.groupby('date').agg({
-            'intensity': 'mean',
-            'confidence': 'mean',
-            'emotion': 'count'
-        }).to_dict('index')
-        
+
+        intensity = self._intensity[:n][mask]
+        confidence = self._confidence[:n][mask]
+        emotion_id = self._emotion_id[:n][mask]
+        ts_ns = self._ts_ns[:n][mask]
+
+        # Emotion distribution via a single histogram pass
+        counts = np.bincount(emotion_id, minlength=len(EmotionType))
+        emotion_distribution = {
+            _EMOTION_VALUES[i]: int(c) for i, c in enumerate(counts) if c
+        }
+
+        # Daily patterns: bucket by integer day, then segment-reduce the
+        # sorted columns with np.add.reduceat
+        day = ts_ns // _NS_PER_DAY
+        order = np.argsort(day, kind='stable')
+        day_sorted = day[order]
+        unique_days, starts = np.unique(day_sorted, return_index=True)
+        day_counts = np.diff(np.append(starts, day_sorted.size))
+        intensity_sums = np.add.reduceat(intensity[order], starts)
+        confidence_sums = np.add.reduceat(confidence[order], starts)
+
+        daily_patterns = {
+            (datetime(1970, 1, 1) + timedelta(days=int(d))).date(): {
+                'intensity': float(isum / c),
+                'confidence': float(csum / c),
+                'emotion': int(c)
+            }
+            for d, c, isum, csum in zip(
+                unique_days, day_counts, intensity_sums, confidence_sums
+            )
+        }
+
         return {
-            'emotion_distribution': emotion_counts.to_dict(),
-            'average_intensity': avg_intensity,
-            'average_confidence': avg_confidence,
+            'emotion_distribution': emotion_distribution,
+            'average_intensity': float(intensity.mean()),
+            'average_confidence': float(confidence.mean()),
             'daily_patterns': daily_patterns,
-            'total_entries': len(recent_data)
+            'total_entries': total_entries
         }
-    
+
     def get_insights(self) -> List[str]:
         """Generate insights from emotion data."""
         insights = []
-        
-        if not self.data:
+
+        n = self._n
+        if n == 0:
             return ['No data available for insights']
-        
-        df = pd.DataFrame(self.data)
-        
-        # Intensity insights
-        avg_intensity = df['intensity'].mean()
+
+        # Intensity insights, from the running aggregates
+        avg_intensity = self._intensity_sum / n
         if avg_intensity > 0.7:
             insights.append("You're experiencing high emotional intensity - great for engagement!")
         elif avg_intensity < 0.4:
             insights.append("Your emotional responses are quite calm - consider trying different reward types")
-        
+
         # Emotion diversity
-        unique_emotions = df['emotion'].nunique()
+        unique_emotions = int((self._emotion_hist > 0).sum())
         if unique_emotions < 3:
             insights.append("Try exploring different types of interactions for more emotional variety")
-        
+
         # Confidence insights
-        avg_confidence = df['confidence'].mean()
+        avg_confidence = self._confidence_sum / n
         if avg_confidence > 0.8:
             insights.append("The AI is very confident in predicting your emotional responses")
         elif avg_confidence < 0.5:
             insights.append("More data would help improve emotion prediction accuracy")
-        
+
         return insights
 
 # Main API class
@@ -495,7 +667,9 @@ class DopamindAI:
     def __init__(self):
         self.emotion_simulator = EmotionSimulator()
         self.dopamine_simulator = DopamineSimulator()
-        self.learning_engine = AdaptiveLearningEngine()
+        self.learning_engine = AdaptiveLearningEngine(
+            self.emotion_simulator, self.dopamine_simulator
+        )
         self.analytics = EmotionAIAnalytics()
     
     def process_reward(
@@ -507,10 +681,10 @@ class DopamindAI:
     ) -> Dict[str, any]:
         """Process a reward and return emotion/dopamine predictions."""
         
-        try:
-            reward_enum = RewardType(reward_type)
-        except ValueError:
+        idx = _REWARD_STR2IDX.get(reward_type)
+        if idx is None:
             return {'error': f'Invalid reward type: {reward_type}'}
+        reward_enum = _REWARD_BY_IDX[idx]
         
         # Get personalized predictions
         emotion_state, dopamine_response = self.learning_engine.get_personalized_prediction(
@@ -531,7 +705,9 @@ class DopamindAI:
                 'type': emotion_state.emotion.value,
                 'intensity': emotion_state.intensity,
                 'confidence': emotion_state.confidence,
-                'timestamp': emotion_state.timestamp.isoformat()
+                # datetime object on purpose - orjson serializes it in C,
+                # and the demo below stringifies it via default=str
+                'timestamp': emotion_state.timestamp
             },
             'dopamine': {
                 'baseline': dopamine_response.baseline,
@@ -544,6 +720,112 @@ class DopamindAI:
             'user_id': user_id
         }
     
+    def process_reward_batch(
+        self,
+        user_id: str,
+        rewards: List[Dict[str, any]]
+    ) -> List[Dict[str, any]]:
+        """Process a batch of rewards for one user in vectorized form.
+
+        Each entry needs 'reward_type' plus optional 'context' and
+        'session_history'. Intensity, confidence and the dopamine fields
+        are computed as NumPy array operations over the whole batch via
+        the reward lookup tables, then the results are written back to
+        the learning engine and analytics in a single pass. Invalid
+        reward types yield an error dict at the same position.
+        """
+        n = len(rewards)
+        if n == 0:
+            return []
+
+        # Parse pass: ordinals and per-item context scalars
+        reward_idx = np.empty(n, dtype=np.intp)
+        fatigue = np.empty(n, dtype=np.float32)
+        stress = np.empty(n, dtype=np.float32)
+        mood_pos = np.empty(n, dtype=bool)
+        recent_same = np.empty(n, dtype=np.int32)
+        history_len = np.empty(n, dtype=np.int32)
+        invalid = {}
+        members = []
+        for i, reward_data in enumerate(rewards):
+            reward_type = reward_data.get('reward_type')
+            idx = _REWARD_STR2IDX.get(reward_type)
+            if idx is None:
+                invalid[i] = {'error': f'Invalid reward type: {reward_type}'}
+                idx = 0  # placeholder; result discarded below
+            members.append(_REWARD_BY_IDX[idx])
+            reward_idx[i] = idx
+            ctx = reward_data.get('context') or {}
+            fatigue[i] = ctx.get('fatigue_level', 0)
+            stress[i] = ctx.get('stress_level', 0)
+            mood_pos[i] = ctx.get('mood', 'neutral') == 'positive'
+            history = reward_data.get('session_history')
+            history_len[i] = len(history) if history else 0
+            recent_same[i] = sum(
+                1 for r in history[-5:] if r.get('type') == reward_type
+            ) if history else 0
+
+        # Vectorized intensity: same factors as _intensity_kernel, with
+        # one bulk jitter draw instead of per-item block consumption
+        intensity = 0.5 + _REWARD_MODIFIERS_ARR[reward_idx]
+        intensity *= np.where(fatigue > 0.7, np.float32(0.8), np.float32(1.0))
+        intensity *= np.where(stress > 0.6, np.float32(0.9), np.float32(1.0))
+        intensity *= np.where(mood_pos, np.float32(1.1), np.float32(1.0))
+        intensity *= np.where(recent_same > 2, np.float32(0.9), np.float32(1.0))
+        intensity += self.emotion_simulator._rng.uniform(-0.1, 0.1, n).astype(np.float32)
+        intensity = np.clip(intensity, 0.0, 1.0)
+
+        confidence = np.where(
+            history_len > 0,
+            np.minimum(0.9, 0.3 + history_len * 0.1),
+            0.5
+        ).astype(np.float32)
+
+        dopamine = self.dopamine_simulator.simulate_dopamine_response_batch(
+            reward_idx, intensity, confidence,
+            {'fatigue': fatigue, 'stress': stress, 'mood_positive': mood_pos}
+        )
+
+        # Write pass: one EmotionState per item feeds learning and
+        # analytics, and the response dicts are built from the arrays
+        results = []
+        for i, reward_data in enumerate(rewards):
+            error = invalid.get(i)
+            if error is not None:
+                results.append(error)
+                continue
+            idx = int(reward_idx[i])
+            reward_enum = members[i]
+            context = reward_data.get('context') or {}
+            emotion_state = EmotionState(
+                emotion=_REWARD_EMOTION[idx],
+                intensity=float(intensity[i]),
+                confidence=float(confidence[i]),
+                timestamp_ns=time.time_ns(),
+                context=context
+            )
+            self.learning_engine.update_patterns(user_id, emotion_state, reward_enum)
+            self.analytics.add_emotion_data(emotion_state, reward_enum)
+            results.append({
+                'emotion': {
+                    'type': emotion_state.emotion.value,
+                    'intensity': emotion_state.intensity,
+                    'confidence': emotion_state.confidence,
+                    'timestamp': emotion_state.timestamp
+                },
+                'dopamine': {
+                    'baseline': float(dopamine['baseline'][i]),
+                    'peak': float(dopamine['peak'][i]),
+                    'duration': float(dopamine['duration'][i]),
+                    'decay_rate': float(dopamine['decay_rate'][i]),
+                    'emotional_impact': float(dopamine['emotional_impact'][i])
+                },
+                'context': context,
+                'user_id': user_id
+            })
+
+        return results
+
     def get_analytics(self, user_id: str, days: int = 7) -> Dict[str, any]:
         """Get analytics for a specific user."""
         trends = self.analytics.get_emotion_trends(days)
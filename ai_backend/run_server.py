@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """
 Dopamind AI Backend - Server Runner
-Simple script to run the AI backend server.
+Launches the API under gunicorn, replacing the old single-process
+Flask development server.
 """
 
 import os
 import sys
 import logging
-from api_server import app
 
 # Configure logging
 logging.basicConfig(
@@ -17,22 +17,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 def main():
-    """Main function to run the server."""
+    """Warm the engine caches, then exec gunicorn in place."""
     logger.info("Starting Dopamind AI Backend Server...")
     logger.info("Server will be available at: http://localhost:5000")
     logger.info("API Documentation: http://localhost:5000/health")
-    
+
+    # Importing the engine compiles the numba kernel into its on-disk
+    # cache, so each gunicorn worker's import loads the compiled kernel
+    # instead of recompiling. No --preload: the app monkey-patches
+    # gevent at import, which must happen in the workers rather than
+    # the master (and preloading would also have every worker inherit
+    # identical RNG state).
+    import emotion_engine  # noqa: F401
+
     try:
-        app.run(
-            host='0.0.0.0',
-            port=5000,
-            debug=False,  # Set to True for development
-            threaded=True
-        )
-    except KeyboardInterrupt:
-        logger.info("Server stopped by user")
-    except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "--workers", str(os.cpu_count()),
+            "--worker-class", "gevent",
+            "--bind", "0.0.0.0:5000",
+            "api_server:app",
+        ])
+    except OSError as e:
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 if __name__ == '__main__':